@@ -2,6 +2,7 @@ from .core import ensure, tap, pipe, Chain, Option, safe
 from .curry import curry
 from .di import Registry, depends
 from .dispatch import dispatcher
+from .fast import jit
 from .result import Result, Ok, Err
 
 __all__ = [
@@ -15,6 +16,7 @@ __all__ = [
     "Registry",
     "depends",
     "dispatcher",
+    "jit",
     "Result",
     "Ok",
     "Err",
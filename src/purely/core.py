@@ -1,15 +1,13 @@
-from __future__ import annotations
-
-import inspect
-from functools import wraps
-from typing import Callable, Any, Iterable, cast as cast_as
-
 """
 PURELY 💧
 A lightweight library for cleaner, safer, and more fluent Python.
 Embrace purity, banish boilerplate.
 """
 
+from __future__ import annotations
+
+from typing import Callable, Any, Iterable
+
 # Sentinel for missing values
 _SENTINEL = object()
 
@@ -19,6 +17,10 @@ _SENTINEL = object()
 # -----------------------------------------------------------------------------
 
 
+# Option and Chain use the PEP 695 class syntax rather than Generic[T]: mypyc
+# compiles a class with an explicit Generic[T] base as a non-native class,
+# which drops the fixed slot layout and rules out Option's __getattr__ and
+# custom __new__.
 class Option[T]:
     """
     A container that represents either a value (Some) or nothing (None).
@@ -27,9 +29,24 @@ class Option[T]:
     item getters and setters, and calling, to allow null-safe navigation.
     """
 
+    __slots__ = ("_value",)
+
+    _value: T | None
+
+    def __new__(cls, value: T | None = None) -> Option[T]:
+        # Every empty Option is the shared _NONE instance
+        if value is None and cls is Option:
+            return _NONE
+
+        return object.__new__(cls)
+
     def __init__(self, value: T | None):
         self._value = value
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuild through the constructor so copies of None stay on _NONE
+        return (type(self), (self._value,))
+
     def is_some(self) -> bool:
         return self._value is not None
 
@@ -39,7 +56,7 @@ class Option[T]:
     def unwrap(
         self,
         default: Any = _SENTINEL,
-        error: str | Exception = ValueError("Called unwrap on None"),
+        error: str | Exception | None = None,
     ) -> T:
         """Returns the contained value or raises error/returns default."""
         if self._value is not None:
@@ -48,7 +65,10 @@ class Option[T]:
         if default is not _SENTINEL:
             return default
 
-        # Use the global ensure logic (which handles exceptions)
+        # The error is only built when we actually fail
+        if error is None:
+            raise ValueError("Called unwrap on None")
+
         if isinstance(error, str):
             raise ValueError(error)
 
@@ -57,7 +77,7 @@ class Option[T]:
     def convert[U](self, func: Callable[[T], U]) -> Option[U]:
         """Strictly typed transformation."""
         if self._value is None:
-            return Option(None)
+            return _NONE
 
         return Option(func(self._value))
 
@@ -68,7 +88,7 @@ class Option[T]:
         if self._value is not None and predicate(self._value):
             return self
 
-        return Option(None)
+        return _NONE
 
     # --- Null Coalescing / Safe Navigation Proxies ---
 
@@ -76,9 +96,15 @@ class Option[T]:
         """
         Runtime hook for safe attribute access.
         Option(obj).attr returns Option(obj.attr) or Option(None).
+
+        Dunder names are never proxied, so protocol probes (copy, pickle,
+        hasattr(opt, "__len__"), ...) see a missing attribute as usual.
         """
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+
         if self._value is None:
-            return Option(None)
+            return _NONE
 
         return Option(getattr(self._value, name))
 
@@ -88,10 +114,10 @@ class Option[T]:
         Option(func)(args) returns Option(func(args)) or Option(None).
         """
         if self._value is None:
-            return Option(None)
+            return _NONE
 
-        caller = getattr(self._value, "__call__")
-        return Option(caller(*args, **kwargs))
+        value: Any = self._value
+        return Option(type(value).__call__(value, *args, **kwargs))
 
     def __getitem__(self, key: Any) -> Option[Any]:
         """
@@ -99,30 +125,42 @@ class Option[T]:
         Option(obj)[key] returns Option(obj[key]) or Option(None).
         """
         if self._value is None:
-            return Option(None)
+            return _NONE
 
-        getter = getattr(self._value, "__getitem__")
-        return Option(getter(key))
+        obj: Any = self._value
+        return Option(type(obj).__getitem__(obj, key))
 
     def __setitem__(self, key: Any, value: Any):
         """
         Runtime hook for safe item setting.
         Option(obj)[key] = value will work if the underlying works.
+        Setting an item on Option(None) does nothing.
         """
-        if self._value is None:
-            pass
+        obj: Any = self._value
+
+        if obj is None:
+            return
 
-        setter = getattr(self._value, "__setitem__")
-        setter(key, value)
+        type(obj).__setitem__(obj, key, value)
 
     def __eq__(self, other: object) -> bool:
         """
         Check the underlying value for equality.
         """
-        if isinstance(other, Option):
-            return self._value == other._value
+        return self._value == (other._value if other.__class__ is Option else other)
 
-        return self._value == other
+    def __hash__(self) -> int:
+        """
+        Hash like the underlying value, consistent with __eq__.
+        Options wrapping unhashable values stay unhashable.
+        """
+        return hash(self._value)
+
+
+# The empty Option, shared by every null-propagating path
+# (a non-None placeholder gets past __new__, as _NONE does not exist yet)
+_NONE: Option[Any] = Option.__new__(Option, _SENTINEL)
+_NONE._value = None
 
 
 # -----------------------------------------------------------------------------
@@ -130,26 +168,27 @@ class Option[T]:
 # -----------------------------------------------------------------------------
 
 
-def ensure[T](
-    value: T | Option[T] | None, error: str | Exception = ValueError("Value is None")
-) -> T:
+def ensure[T](value: T | Option[T] | None, error: str | Exception | None = None) -> T:
     """
     Asserts existence.
 
     If 'value' is an Option (from safe() runtime), it unwraps it.
     If 'value' is a raw value (from safe() static lie), it checks for None.
     """
-    # Runtime check: Handle the 'Safe' proxy case
-    if isinstance(value, Option):
-        return value.unwrap(error=error)
-
     if value is None:
+        if error is None:
+            raise ValueError("Value is None")
+
         if isinstance(error, str):
             raise ValueError(error)
 
         raise error
 
-    return cast_as(T, value)
+    # Runtime check: Handle the 'Safe' proxy case
+    if isinstance(value, Option):
+        return value.unwrap(error="Value is None" if error is None else error)
+
+    return value  # type: ignore[return-value]
 
 
 def safe[T](obj: T | None) -> T:
@@ -159,8 +198,28 @@ def safe[T](obj: T | None) -> T:
     This allows the user you continue using Intellisense
     and type-checking from the IDE but maintaining the
     null-safe navigation.
+
+    None, booleans and small ints get shared wrappers instead of a new
+    Option on every call.
     """
-    return cast_as(T, Option(obj))
+    if obj is None:
+        return _NONE  # type: ignore[return-value]
+
+    value: Any = obj
+
+    if type(value) is int and -5 <= value <= 256:
+        return _SAFE_SMALL_INTS[value + 5]
+
+    if type(value) is bool:
+        return _SAFE_BOOLS[value]
+
+    return Option(obj)  # type: ignore[return-value]
+
+
+# Prebuilt wrappers for the constants safe() sees most often. Only values
+# that are cheap and bounded are shared; they never change once wrapped.
+_SAFE_SMALL_INTS: list[Any] = [Option(i) for i in range(-5, 257)]
+_SAFE_BOOLS: list[Any] = [Option(False), Option(True)]
 
 
 def tap[T](value: T, func: Callable[[T], Any]) -> T:
@@ -181,7 +240,7 @@ def cast[T](t: type[T], x: Any) -> T:
     if not isinstance(x, t):
         raise TypeError(f"Cannot cast {type(x)} to {t}")
 
-    return cast_as(T, x)
+    return x
 
 
 # -----------------------------------------------------------------------------
@@ -198,6 +257,11 @@ class Chain[T]:
     3. Error Handling (catch, test)
     """
 
+    __slots__ = ("_value", "_error")
+
+    _value: T | None
+    _error: Exception | None
+
     def __init__(self, value: T | None, error: Exception | None = None):
         self._value = value
         self._error = error
@@ -221,7 +285,7 @@ class Chain[T]:
         Chain(None).then(lambda x: x + 1) -> Chain(Error) [Swallows exception]
         """
         if self._error:
-            return cast_as(Chain[R], self)
+            return self  # type: ignore[return-value]
 
         try:
             return Chain(func(self._value))  # type: ignore
@@ -230,7 +294,29 @@ class Chain[T]:
 
     def __or__[R](self, func: Callable[[T], R]) -> Chain[R]:
         """Syntactic sugar for .then()"""
-        return self.then(func)
+        if self._error:
+            return self  # type: ignore[return-value]
+
+        # Same as .then(), inlined to save a method call per stage
+        try:
+            return Chain(func(self._value))  # type: ignore
+        except Exception as e:
+            return Chain(None, error=e)
+
+    def pipe(self, *funcs: Callable[[Any], Any]) -> Chain[Any]:
+        """
+        Pipes the value through all funcs in a single step.
+
+        Chain(5).pipe(f, g, h) == Chain(5) | f | g | h, but without
+        allocating a Chain for every intermediate stage.
+        """
+        if self._error:
+            return self
+
+        try:
+            return Chain(pipe(self._value, *funcs))
+        except Exception as e:
+            return Chain(None, error=e)
 
     def tap(self, func: Callable[[T], Any]) -> Chain[T]:
         if self.is_ok:
@@ -254,7 +340,7 @@ class Chain[T]:
         If requirements fail, the Chain switches to Error state.
         """
         if self._error:
-            return cast(Chain[Iterable[R]], self)
+            return self  # type: ignore[return-value]
 
         try:
             val = self._value
@@ -275,7 +361,7 @@ class Chain[T]:
         Same strict iterable requirements as .map().
         """
         if self._error:
-            return cast(Chain[list], self)
+            return self  # type: ignore[return-value]
 
         try:
             val = self._value
@@ -296,7 +382,7 @@ class Chain[T]:
         If Error: Raises the error (or returns default if provided).
         """
         if self._error is None:
-            return cast_as(T, self._value)
+            return self._value  # type: ignore[return-value]
 
         if default is not _SENTINEL:
             return default
@@ -0,0 +1,91 @@
+"""
+Optional JIT acceleration for numeric pipelines.
+
+Functions decorated with `jit` are compiled with numba, and `pipe` fuses
+a sequence of them into a single compiled function, so the whole pipeline
+runs without going back to the interpreter between stages. Requires the
+`fast` extra (`pip install purely[fast]`).
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, overload
+
+from .core import pipe as _pipe
+
+
+def _numba() -> Any:
+    try:
+        import numba
+    except ImportError as e:
+        raise ImportError(
+            "purely.fast requires numba, install it with `pip install purely[fast]`"
+        ) from e
+
+    return numba
+
+
+@overload
+def jit[F: Callable[..., Any]](func: F, *, cache: bool = True) -> F: ...
+
+
+@overload
+def jit[F: Callable[..., Any]](
+    func: None = None, *, cache: bool = True
+) -> Callable[[F], F]: ...
+
+
+def jit(func: Any = None, *, cache: bool = True) -> Any:
+    """
+    Compiles func in nopython mode and marks it as fusable by pipe.
+
+    Use as `@jit` or `@jit(cache=False)`. Compiled code is cached on disk
+    unless cache=False. Functions without a source file to cache next to
+    (stdin, `python -c`, exec'd code) are compiled without the cache.
+    """
+    if func is None:
+        return lambda f: jit(f, cache=cache)
+
+    compiled = _numba().njit(func)
+
+    if cache:
+        try:
+            compiled.enable_caching()
+        except RuntimeError:
+            # numba found no cache locator for the function's source
+            pass
+
+    compiled.__is_purely_jit__ = True
+    return compiled
+
+
+def _fuse(first: Callable[[Any], Any], second: Callable[[Any], Any]) -> Any:
+    @_numba().njit
+    def fused(value):
+        return second(first(value))
+
+    return fused
+
+
+@lru_cache(maxsize=128)
+def _njit_compose(funcs: tuple[Callable[[Any], Any], ...]) -> Callable[[Any], Any]:
+    """Fuses jitted funcs into one compiled function, applied left to right."""
+    composed = funcs[0]
+
+    for func in funcs[1:]:
+        composed = _fuse(composed, func)
+
+    return composed
+
+
+def pipe(value: Any, *funcs: Callable[[Any], Any]) -> Any:
+    """
+    Pipes value through functions, like purely.pipe.
+
+    If every function was decorated with `jit`, the pipeline is compiled
+    once into a single function and reused on later calls. Otherwise it
+    falls back to the pure-Python pipe.
+    """
+    if funcs and all(getattr(f, "__is_purely_jit__", False) for f in funcs):
+        return _njit_compose(funcs)(value)
+
+    return _pipe(value, *funcs)
@@ -23,6 +23,18 @@ def test_chain_pipeline_pipe_operator():
     assert res == "10"
 
 
+def test_chain_pipeline_pipe_method():
+    """
+    Verify .pipe() applies several functions in one step, like |
+    """
+    res = Chain(5).pipe(lambda x: x + 5, str, lambda s: s + "!").unwrap()
+    assert res == "10!"
+
+    c = Chain(5).pipe(lambda x: x / 0, str)
+    assert isinstance(c.error(), ZeroDivisionError)
+    assert c.pipe(str) is c
+
+
 def test_chain_pipeline_error_capture():
     """
     Verify that exceptions in the pipeline are caught and stored,
@@ -201,3 +213,48 @@ def test_integration_mixed_failure():
     # It should fail because one item (None) caused a TypeError
     assert not c.is_ok
     assert isinstance(c.error(), TypeError)
+
+
+def test_chain_has_no_instance_dict():
+    """Chain is a fixed-layout wrapper, arbitrary attributes are rejected."""
+    c = Chain(10)
+
+    with pytest.raises(AttributeError):
+        c.extra = 1
+
+
+def test_chain_pipe_operator_does_not_mutate_named_chain():
+    """Only temporaries are reused by |, a named Chain keeps its value."""
+    base = Chain(5)
+    derived = base | (lambda x: x + 1)
+
+    assert base.unwrap() == 5
+    assert derived.unwrap() == 6
+    assert derived is not base
+
+
+def test_chain_pipe_operator_does_not_mutate_borrowed_chain():
+    """| never mutates its left operand, even when C code only borrows it."""
+    import operator
+
+    args = (Chain(3), lambda x: x + 1)
+    derived = operator.or_(*args)
+
+    assert args[0].unwrap() == 3
+    assert derived.unwrap() == 4
+    assert derived is not args[0]
+
+
+def test_chain_pipe_operator_captures_error_on_temporaries():
+    c = Chain(5) | (lambda x: x / 0) | (lambda x: x + 1)
+
+    assert not c.is_ok
+    assert isinstance(c.error(), ZeroDivisionError)
+
+
+def test_chain_vectorized_ops_skip_on_error():
+    """.map() and .filter() pass a failed Chain through untouched."""
+    failed = Chain.fail(ValueError("boom"))
+
+    assert failed.map(lambda x: x).error() is failed.error()
+    assert failed.filter(lambda x: True).error() is failed.error()
@@ -40,3 +40,35 @@ def test_option_none():
     opt = Option(10).keepif(lambda x: x > 100).convert(lambda x: x * 2)
     assert opt.is_none()
     assert opt.unwrap(default=999) == 999
+
+
+def test_pipe_arities():
+    for n in range(12):
+        assert pipe(0, *[lambda x: x + 1] * n) == n
+
+
+def test_ensure_default_error_is_fresh():
+    with pytest.raises(ValueError, match="Value is None") as first:
+        ensure(None)
+
+    with pytest.raises(ValueError, match="Value is None") as second:
+        ensure(Option(None))
+
+    with pytest.raises(ValueError, match="Called unwrap on None"):
+        Option(None).unwrap()
+
+    with pytest.raises(ValueError, match="Value is None") as third:
+        ensure(None)
+
+    assert first.value is not third.value
+    assert second.value is not first.value
+
+
+def test_option_equality_and_hash():
+    assert Option(3) == Option(3)
+    assert Option(3) == 3
+    assert Option(None) == Option(None)
+    assert {Option("a"), Option("a"), "b"} == {"a", "b"}
+
+    with pytest.raises(TypeError):
+        hash(Option([1, 2]))
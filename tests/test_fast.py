@@ -0,0 +1,57 @@
+import pytest
+from purely import fast
+
+
+def test_fast_pipe_falls_back_to_python():
+    # Plain functions are not fusable, behaves exactly like purely.pipe
+    assert fast.pipe(5, lambda x: x * 2, str) == "10"
+    assert fast.pipe(5) == 5
+
+
+def test_fast_pipe_fuses_jitted_functions():
+    pytest.importorskip("numba")
+
+    @fast.jit
+    def double(x):
+        return x * 2
+
+    @fast.jit
+    def inc(x):
+        return x + 1
+
+    assert fast.pipe(5, double, inc) == 11
+    assert fast.pipe(1.5, inc, double, inc) == 6.0
+
+    hits = fast._njit_compose.cache_info().hits
+    fast.pipe(2, double, inc)
+    assert fast._njit_compose.cache_info().hits == hits + 1
+
+
+def test_fast_pipe_mixed_functions_fall_back():
+    pytest.importorskip("numba")
+
+    @fast.jit
+    def double(x):
+        return x * 2
+
+    assert fast.pipe(5, double, str) == "10"
+
+
+def test_fast_jit_without_source_file():
+    pytest.importorskip("numba")
+
+    namespace = {}
+    exec("def inc(x):\n    return x + 1\n", namespace)
+    inc = fast.jit(namespace["inc"])
+
+    assert fast.pipe(1, inc, inc) == 3
+
+
+def test_fast_jit_cache_disabled():
+    pytest.importorskip("numba")
+
+    @fast.jit(cache=False)
+    def double(x):
+        return x * 2
+
+    assert fast.pipe(3, double, double) == 12
@@ -129,3 +129,97 @@ def test_ensure_integration():
 
     with pytest.raises(ValueError):
         ensure(safe(User()).address)
+
+
+def test_safe_navigation_calls_and_items_on_classes():
+    """Calling and indexing go through the type, like the plain operators."""
+    assert ensure(safe(dict)(a=1)["a"]) == 1
+
+    data = {"a": 1}
+    safe(data)["b"] = 2
+    assert data == {"a": 1, "b": 2}
+
+
+def test_safe_navigation_none_is_shared():
+    """Every empty Option is the same instance, no matter how it was reached."""
+    empty = Option(None)
+
+    assert safe(None) is empty
+    assert safe(User()).address.city.name is empty
+    assert Option(10).keepif(lambda x: x > 100) is empty
+    assert Option(5).is_some()
+
+
+def test_option_copy_and_pickle():
+    import copy
+    import pickle
+
+    assert ensure(copy.copy(Option(5))) == 5
+    assert ensure(pickle.loads(pickle.dumps(Option([1, 2])))) == [1, 2]
+    assert copy.deepcopy(Option(None)) is Option(None)
+
+
+class Maybe(Option):
+    pass
+
+
+def test_ensure_unwraps_option_subclasses():
+    try:
+        empty = Maybe(None)
+    except TypeError:
+        pytest.skip("compiled Option cannot be subclassed from Python")
+
+    assert ensure(Maybe(5)) == 5
+
+    with pytest.raises(ValueError, match="Value is None"):
+        ensure(empty)
+
+
+def test_option_subclass_copy_and_pickle():
+    import copy
+    import pickle
+
+    try:
+        original = Maybe(5)
+    except TypeError:
+        pytest.skip("compiled Option cannot be subclassed from Python")
+
+    copied = copy.copy(original)
+    assert type(copied) is Maybe
+    assert copied.unwrap() == 5
+
+    empty = pickle.loads(pickle.dumps(Maybe(None)))
+    assert type(empty) is Maybe
+    assert empty.is_none()
+
+
+def test_safe_navigation_does_not_proxy_dunders():
+    """Protocol probes must not be turned into Option wrappers."""
+    opt = safe(User(tags=["a"]))
+
+    assert not hasattr(opt, "__len__")
+    assert not hasattr(safe(None), "__iter__")
+    assert ensure(opt.tags[0]) == "a"
+
+
+def test_safe_navigation_setitem_on_none():
+    """Setting an item through a broken chain is a silent no-op."""
+    safe(User()).address.metadata["zip"] = "00000"
+
+    u = User(address=Address())
+    safe(u).address.metadata["zip"] = "00000"
+    assert u.address.metadata["zip"] == "00000"
+
+
+def test_safe_shares_wrappers_for_constants():
+    """safe() reuses wrappers for None, booleans and small ints."""
+    assert safe(None) is Option(None)
+    assert safe(7) is safe(7)
+    assert safe(1) is not safe(True)
+    assert ensure(safe(True)) is True
+    assert ensure(safe(0)) == 0
+
+    # Everything else always gets its own wrapper
+    assert safe(10**6) is not safe(10**6)
+    assert safe("abc") is not safe("abc")
+    assert safe([1]) is not safe([1])